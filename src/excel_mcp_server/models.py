@@ -1,13 +1,89 @@
 """Pydantic models for Excel operations"""
 
-import re
-from typing import Any
+from functools import lru_cache
+from typing import Annotated, Any, Literal
+
+from openpyxl.utils.cell import coordinate_to_tuple
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    StringConstraints,
+    field_validator,
+)
+
+# Memoized: openpyxl parses the coordinate with a regex each call, and agents
+# reference the same cells repeatedly
+coordinate_to_tuple = lru_cache(maxsize=4096)(coordinate_to_tuple)
+
+# Single source for each pattern; every field referencing an alias below shares
+# the one compiled pattern instead of duplicating it per model
+_CELL_PATTERN = r"^[A-Za-z]{1,3}[1-9]\d*$"
+_RANGE_PATTERN = r"^[A-Za-z]{1,3}[1-9]\d*:[A-Za-z]{1,3}[1-9]\d*$"
+
+
+# Excel's hard sheet limit; the range pattern's [1-9]\d* is unbounded, so the
+# row cap and endpoint ordering are enforced after the regex match
+_MAX_ROW = 1_048_576
+
+
+def _check_range(v: str) -> str:
+    """Reject ranges past Excel's row limit or with reversed endpoints"""
+    start, end = v.split(":")
+    start_row, start_col = coordinate_to_tuple(start)
+    end_row, end_col = coordinate_to_tuple(end)
+    if end_row > _MAX_ROW or start_row > _MAX_ROW:
+        raise ValueError(
+            f"Row number {max(start_row, end_row)} exceeds Excel's maximum ({_MAX_ROW})"
+        )
+    if start_row > end_row or start_col > end_col:
+        raise ValueError(f"Start cell must not be past end cell: {v}")
+    return v
+
+
+def _parse_hex6(v: str) -> str:
+    """Validate and normalize a 6-digit hex color (int parse; no regex)"""
+    v = v.lstrip("#")
+    # isascii() matters: both isalnum() and int(v, 16) accept Unicode decimal
+    # digits, which the regex this replaced never did
+    if len(v) != 6 or not v.isascii() or not v.isalnum():
+        raise ValueError(f"Invalid hex color: {v}")
+    try:
+        int(v, 16)
+    except ValueError:
+        raise ValueError(f"Invalid hex color: {v}") from None
+    return v.upper()
+
+
+# Constrained string types validated inside pydantic-core (no Python callback per field)
+CellRef = Annotated[str, StringConstraints(pattern=_CELL_PATTERN, to_upper=True)]
+RangeRef = Annotated[
+    str, StringConstraints(pattern=_RANGE_PATTERN, to_upper=True), AfterValidator(_check_range)
+]
+HexColor = Annotated[str, AfterValidator(_parse_hex6)]
+
+
+class _FastBase(BaseModel):
+    """Shared config for one-shot request/result DTOs
+
+    These models are built once per MCP call and then only read, so skip
+    assignment validation, ignore unknown fields, and freeze instances to
+    keep pydantic-core on its fast path.
+    """
+
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        str_strip_whitespace=False,
+        validate_assignment=False,
+    )
 
-from pydantic import BaseModel, Field, field_validator
 
 # ========== Base Result Models ==========
 
-class OperationResult(BaseModel):
+class OperationResult(_FastBase):
     """Base result model for all operations"""
 
     success: bool
@@ -44,7 +120,7 @@ class RangeResult(OperationResult):
 
 # ========== Request Models ==========
 
-class WorkbookInfo(BaseModel):
+class WorkbookInfo(_FastBase):
     """Workbook metadata"""
 
     file_path: str
@@ -53,71 +129,57 @@ class WorkbookInfo(BaseModel):
     file_size: int | None = None
 
 
-class CellWriteRequest(BaseModel):
+class CellWriteRequest(_FastBase):
     """Request to write a value to a cell"""
 
     workbook_path: str = Field(..., description="Path to the Excel workbook")
     sheet_name: str = Field(..., description="Name of the worksheet")
-    cell: str = Field(..., description="Cell reference (e.g., 'A1')")
+    cell: CellRef = Field(..., description="Cell reference (e.g., 'A1')")
     value: Any = Field(..., description="Value to write to the cell")
 
-    @field_validator("cell")
-    @classmethod
-    def validate_cell(cls, v: str) -> str:
-        """Validate cell reference format"""
-        if not re.match(r"^[A-Z]{1,3}[1-9]\d*$", v.upper()):
-            raise ValueError(f"Invalid cell reference: {v}")
-        return v.upper()
+    # Parsed once at construction; operations index via ws.cell(row, col)
+    _rc: tuple[int, int] = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rc = coordinate_to_tuple(self.cell)
 
 
-class CellReadRequest(BaseModel):
+class CellReadRequest(_FastBase):
     """Request to read a cell value"""
 
     workbook_path: str
     sheet_name: str
-    cell: str
+    cell: CellRef
 
-    @field_validator("cell")
-    @classmethod
-    def validate_cell(cls, v: str) -> str:
-        if not re.match(r"^[A-Z]{1,3}[1-9]\d*$", v.upper()):
-            raise ValueError(f"Invalid cell reference: {v}")
-        return v.upper()
+    _rc: tuple[int, int] = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rc = coordinate_to_tuple(self.cell)
 
 
-class RangeWriteRequest(BaseModel):
+class RangeWriteRequest(_FastBase):
     """Request to write data to a range"""
 
     workbook_path: str
     sheet_name: str
-    start_cell: str = Field(..., description="Top-left cell of the range (e.g., 'A1')")
+    start_cell: CellRef = Field(..., description="Top-left cell of the range (e.g., 'A1')")
     data: list[list[Any]] = Field(..., description="2D list of values to write")
 
-    @field_validator("start_cell")
-    @classmethod
-    def validate_cell(cls, v: str) -> str:
-        if not re.match(r"^[A-Z]{1,3}[1-9]\d*$", v.upper()):
-            raise ValueError(f"Invalid cell reference: {v}")
-        return v.upper()
+    _rc: tuple[int, int] = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rc = coordinate_to_tuple(self.start_cell)
 
 
-class RangeReadRequest(BaseModel):
+class RangeReadRequest(_FastBase):
     """Request to read a range of cells"""
 
     workbook_path: str
     sheet_name: str
-    range_ref: str = Field(..., description="Range reference (e.g., 'A1:D10')")
+    range_ref: RangeRef = Field(..., description="Range reference (e.g., 'A1:D10')")
 
-    @field_validator("range_ref")
-    @classmethod
-    def validate_range(cls, v: str) -> str:
-        """Validate range reference format"""
-        if not re.match(r"^[A-Z]{1,3}[1-9]\d*:[A-Z]{1,3}[1-9]\d*$", v.upper()):
-            raise ValueError(f"Invalid range reference: {v}")
-        return v.upper()
 
-
-class SheetCreateRequest(BaseModel):
+class SheetCreateRequest(_FastBase):
     """Request to create a new sheet"""
 
     workbook_path: str
@@ -125,7 +187,7 @@ class SheetCreateRequest(BaseModel):
     index: int | None = Field(None, description="Position to insert the sheet")
 
 
-class SheetRenameRequest(BaseModel):
+class SheetRenameRequest(_FastBase):
     """Request to rename a sheet"""
 
     workbook_path: str
@@ -133,20 +195,18 @@ class SheetRenameRequest(BaseModel):
     new_name: str
 
 
-class FormulaWriteRequest(BaseModel):
+class FormulaWriteRequest(_FastBase):
     """Request to write a formula to a cell"""
 
     workbook_path: str
     sheet_name: str
-    cell: str
+    cell: CellRef
     formula: str = Field(..., description="Excel formula (should start with '=')")
 
-    @field_validator("cell")
-    @classmethod
-    def validate_cell(cls, v: str) -> str:
-        if not re.match(r"^[A-Z]{1,3}[1-9]\d*$", v.upper()):
-            raise ValueError(f"Invalid cell reference: {v}")
-        return v.upper()
+    _rc: tuple[int, int] = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rc = coordinate_to_tuple(self.cell)
 
     @field_validator("formula")
     @classmethod
@@ -159,88 +219,49 @@ class FormulaWriteRequest(BaseModel):
 
 # ========== Formatting Models ==========
 
-class FontFormatRequest(BaseModel):
+class FontFormatRequest(_FastBase):
     """Request to format font"""
 
     workbook_path: str
     sheet_name: str
-    range_ref: str = Field(..., description="Range to format (e.g., 'A1:B10')")
+    range_ref: RangeRef = Field(..., description="Range to format (e.g., 'A1:B10')")
     font_name: str | None = Field(None, description="Font name (e.g., 'Arial', 'Calibri')")
     font_size: int | None = Field(None, ge=8, le=72, description="Font size (8-72)")
     bold: bool | None = None
     italic: bool | None = None
     underline: str | None = Field(None, description="'single', 'double', or None")
-    color: str | None = Field(None, description="Hex color code (e.g., 'FF0000')")
+    color: HexColor | None = Field(None, description="Hex color code (e.g., 'FF0000')")
 
-    @field_validator("color")
-    @classmethod
-    def validate_color(cls, v: str | None) -> str | None:
-        """Validate hex color format"""
-        if v is None:
-            return v
-        # Remove # if present
-        v = v.lstrip("#")
-        if not re.match(r"^[0-9A-Fa-f]{6}$", v):
-            raise ValueError(f"Invalid hex color: {v}")
-        return v.upper()
-
-
-class FillFormatRequest(BaseModel):
+
+class FillFormatRequest(_FastBase):
     """Request to format cell fill (background color)"""
 
     workbook_path: str
     sheet_name: str
-    range_ref: str
+    range_ref: RangeRef
     fill_type: str = Field("solid", description="Fill type: 'solid' or 'pattern'")
-    color: str = Field(..., description="Hex color code (e.g., 'FFFF00')")
-
-    @field_validator("color")
-    @classmethod
-    def validate_color(cls, v: str) -> str:
-        v = v.lstrip("#")
-        if not re.match(r"^[0-9A-Fa-f]{6}$", v):
-            raise ValueError(f"Invalid hex color: {v}")
-        return v.upper()
+    color: HexColor = Field(..., description="Hex color code (e.g., 'FFFF00')")
 
 
-class BorderFormatRequest(BaseModel):
+class BorderFormatRequest(_FastBase):
     """Request to format cell borders"""
 
     workbook_path: str
     sheet_name: str
-    range_ref: str
+    range_ref: RangeRef
     style: str = Field("thin", description="Border style: 'thin', 'medium', 'thick', 'double'")
-    color: str | None = Field(None, description="Hex color code")
-    sides: list[str] = Field(
-        ["top", "bottom", "left", "right"], description="Which sides to apply border to"
+    color: HexColor | None = Field(None, description="Hex color code")
+    sides: tuple[Literal["top", "bottom", "left", "right"], ...] = Field(
+        ("top", "bottom", "left", "right"), description="Which sides to apply border to"
     )
 
-    @field_validator("color")
-    @classmethod
-    def validate_color(cls, v: str | None) -> str | None:
-        if v is None:
-            return v
-        v = v.lstrip("#")
-        if not re.match(r"^[0-9A-Fa-f]{6}$", v):
-            raise ValueError(f"Invalid hex color: {v}")
-        return v.upper()
-
-    @field_validator("sides")
-    @classmethod
-    def validate_sides(cls, v: list[str]) -> list[str]:
-        valid_sides = {"top", "bottom", "left", "right"}
-        for side in v:
-            if side not in valid_sides:
-                raise ValueError(f"Invalid side: {side}. Must be one of {valid_sides}")
-        return v
-
 
-class AlignmentFormatRequest(BaseModel):
+class AlignmentFormatRequest(_FastBase):
     """Request to format cell alignment"""
 
     workbook_path: str
     sheet_name: str
-    range_ref: str
+    range_ref: RangeRef
     horizontal: str | None = Field(
         None, description="Horizontal alignment: 'left', 'center', 'right'"
     )
@@ -249,12 +270,12 @@ class AlignmentFormatRequest(BaseModel):
     text_rotation: int | None = Field(None, ge=0, le=180, description="Text rotation (0-180)")
 
 
-class NumberFormatRequest(BaseModel):
+class NumberFormatRequest(_FastBase):
     """Request to format numbers"""
 
     workbook_path: str
     sheet_name: str
-    range_ref: str
+    range_ref: RangeRef
     format_string: str = Field(
         ...,
         description="Excel number format string (e.g., '0.00', '#,##0', '0%', '$#,##0.00', 'mm/dd/yyyy')",
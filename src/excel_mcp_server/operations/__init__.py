@@ -1,5 +1,5 @@
 """Excel operations business logic"""
 
-from . import cell, formatting, sheet, workbook
+from . import batch, cell, formatting, sheet, workbook
 
-__all__ = ["workbook", "cell", "sheet", "formatting"]
+__all__ = ["workbook", "cell", "sheet", "formatting", "batch"]
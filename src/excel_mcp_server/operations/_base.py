@@ -0,0 +1,88 @@
+"""Shared request-handler plumbing for operation functions"""
+
+from collections.abc import Callable
+from functools import lru_cache, wraps
+from typing import Any, TypeVar
+
+from openpyxl.utils import range_boundaries
+from pydantic import BaseModel
+
+from ..models import OperationResult
+from ..utils.validators import validate_file_path
+from ..workbook_cache import get_workbook_sheets, invalidate, save_workbook
+
+ResultT = TypeVar("ResultT", bound=OperationResult)
+
+# Memoized range parsing: agents hit the same refs over and over, and
+# range_boundaries runs a regex per endpoint on every call
+range_bounds = lru_cache(maxsize=4096)(range_boundaries)
+
+
+def with_workbook(
+    result_cls: type[ResultT],
+    failure: str,
+    *,
+    read_only: bool = False,
+    data_only: bool = False,
+    save: bool = True,
+) -> Callable[[Callable[[Any, Any], ResultT]], Callable[[BaseModel], ResultT]]:
+    """
+    Decorator handling the prologue/epilogue every operation repeats.
+
+    Validates the workbook path, resolves a cached workbook handle and the
+    requested worksheet, then calls the wrapped function as fn(request, ws).
+    On success the workbook is saved (unless save=False for read paths);
+    failures are wrapped into the given result class.
+
+    Args:
+        result_cls: Result model to build for error returns
+        failure: Message prefix for unexpected exceptions
+        read_only: Open the workbook in openpyxl's streaming read-only mode
+        data_only: Load cached formula results instead of formulas
+        save: Save the workbook after a successful call
+
+    Returns:
+        Decorator wrapping fn(request, ws) into fn(request)
+    """
+
+    def decorator(fn: Callable[[Any, Any], ResultT]) -> Callable[[BaseModel], ResultT]:
+        @wraps(fn)
+        def wrapper(request: Any) -> ResultT:
+            try:
+                # Validate file path
+                is_valid, error = validate_file_path(request.workbook_path, must_exist=True)
+                if not is_valid:
+                    return result_cls.model_construct(success=False, message=error)
+
+                # Get workbook (cached across calls; reloaded if the file changed on disk)
+                wb, sheets = get_workbook_sheets(
+                    request.workbook_path,
+                    data_only=data_only,
+                    read_only=read_only,
+                    keep_links=not read_only,
+                )
+
+                # Check if sheet exists (set membership against the cached name set)
+                if request.sheet_name not in sheets:
+                    return result_cls.model_construct(
+                        success=False,
+                        message=f"Sheet '{request.sheet_name}' not found. "
+                        f"Available sheets: {sorted(sheets)}",
+                    )
+
+                result = fn(request, wb[request.sheet_name])
+
+                if save and result.success:
+                    save_workbook(wb, request.workbook_path)
+
+                return result
+
+            except Exception as e:
+                if save:
+                    # Drop a possibly half-mutated cached handle
+                    invalidate(request.workbook_path)
+                return result_cls.model_construct(success=False, message=f"{failure}: {str(e)}")
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,150 @@
+"""Batched operations against a single workbook"""
+
+import os
+from typing import Any
+
+from pydantic import ValidationError
+
+from ..models import (
+    AlignmentFormatRequest,
+    BorderFormatRequest,
+    CellWriteRequest,
+    FillFormatRequest,
+    FontFormatRequest,
+    FormulaWriteRequest,
+    NumberFormatRequest,
+    RangeWriteRequest,
+)
+from ..utils.validators import validate_file_path
+from ..workbook_cache import get_workbook_sheets, invalidate, save_workbook
+from . import cell, formatting
+
+# Operation name -> (request model, core function). with_workbook preserves the
+# undecorated core via functools.wraps, so __wrapped__ is the fn(request, ws)
+# body that operates on an already-resolved worksheet — exactly what a batch
+# driver holding one open workbook needs.
+_OPS = {
+    "write_cell": (CellWriteRequest, cell.write_cell_value.__wrapped__),
+    "write_range": (RangeWriteRequest, cell.write_range_values.__wrapped__),
+    "write_formula": (FormulaWriteRequest, cell.write_formula.__wrapped__),
+    "format_font": (FontFormatRequest, formatting.format_font.__wrapped__),
+    "format_fill": (FillFormatRequest, formatting.format_fill.__wrapped__),
+    "format_border": (BorderFormatRequest, formatting.format_border.__wrapped__),
+    "format_alignment": (AlignmentFormatRequest, formatting.format_alignment.__wrapped__),
+    "format_number": (NumberFormatRequest, formatting.format_number.__wrapped__),
+}
+
+
+def apply(workbook_path: str, ops: list[dict]) -> dict:
+    """
+    Apply a list of operations to one workbook, saving once at the end.
+
+    Each op dict names its operation under "op" plus the operation's own
+    parameters (everything the matching single-op tool takes except
+    workbook_path), e.g. {"op": "write_cell", "sheet_name": "Sheet1",
+    "cell": "A1", "value": 42}. Per-op failures are recorded and the batch
+    continues; the workbook is serialized a single time instead of once per
+    operation.
+
+    Args:
+        workbook_path: Path to the Excel workbook
+        ops: List of operation dicts
+
+    Returns:
+        Dictionary with overall success, a summary message, and per-op results
+    """
+    is_valid, error = validate_file_path(workbook_path, must_exist=True)
+    if not is_valid:
+        return {"success": False, "message": error, "results": []}
+
+    results: list[dict] = []
+    try:
+        wb, sheets = get_workbook_sheets(workbook_path)
+
+        for op in ops:
+            op_name = op.get("op")
+            spec = _OPS.get(op_name)
+            if spec is None:
+                results.append(
+                    {
+                        "success": False,
+                        "message": f"Unknown operation: {op_name!r}. "
+                        f"Supported: {sorted(_OPS)}",
+                    }
+                )
+                continue
+
+            model, core = spec
+            # workbook_path is fixed for the whole batch. Tolerate an op
+            # redundantly repeating it, but a *different* path is a per-op
+            # failure — silently redirecting the write would be worse than the
+            # TypeError it used to raise
+            op_path = op.get("workbook_path")
+            if op_path is not None and os.path.abspath(op_path) != os.path.abspath(workbook_path):
+                results.append(
+                    {
+                        "success": False,
+                        "message": f"Op workbook_path '{op_path}' does not match the "
+                        f"batch workbook '{workbook_path}'",
+                    }
+                )
+                continue
+
+            params = {k: v for k, v in op.items() if k not in ("op", "workbook_path")}
+            try:
+                request = model(workbook_path=workbook_path, **params)
+            except ValidationError as e:
+                results.append({"success": False, "message": f"Invalid {op_name} op: {str(e)}"})
+                continue
+
+            if request.sheet_name not in sheets:
+                results.append(
+                    {
+                        "success": False,
+                        "message": f"Sheet '{request.sheet_name}' not found. "
+                        f"Available sheets: {sorted(sheets)}",
+                    }
+                )
+                continue
+
+            result = core(request, wb[request.sheet_name])
+            results.append(result.model_dump())
+
+        # One save for the whole batch (only if something actually succeeded)
+        if any(r.get("success") for r in results):
+            save_workbook(wb, workbook_path)
+
+    except Exception as e:
+        # Drop a possibly half-mutated cached handle
+        invalidate(workbook_path)
+        return {"success": False, "message": f"Batch failed: {str(e)}", "results": results}
+
+    succeeded = sum(1 for r in results if r.get("success"))
+    return {
+        "success": succeeded == len(results),
+        "message": f"{succeeded}/{len(results)} operations succeeded",
+        "results": results,
+    }
+
+
+def write_cells(workbook_path: str, cells: list[tuple[str, str, Any]]) -> dict:
+    """
+    Write many cell values with one workbook resolution and one save.
+
+    Convenience wrapper over apply() for the most common batch: plain value
+    writes as (sheet_name, cell, value) tuples.
+
+    Args:
+        workbook_path: Path to the Excel workbook
+        cells: List of (sheet_name, cell, value) tuples
+
+    Returns:
+        Dictionary with overall success, a summary message, and per-op results
+    """
+    return apply(
+        workbook_path,
+        [
+            {"op": "write_cell", "sheet_name": sheet, "cell": cell, "value": value}
+            for sheet, cell, value in cells
+        ],
+    )
@@ -1,9 +1,12 @@
 """Formatting operations"""
 
-from typing import Any, cast
+from __future__ import annotations
 
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from openpyxl.styles import Alignment, Border, Font, PatternFill
 
 from ..models import (
     AlignmentFormatRequest,
@@ -13,302 +16,218 @@ from ..models import (
     NumberFormatRequest,
     OperationResult,
 )
-from ..utils.validators import validate_file_path, validate_range_reference
-
-
-def format_font(request: FontFormatRequest) -> OperationResult:
+from ._base import range_bounds, with_workbook
+
+# Memoized style factories: repeated identical format requests reuse one style
+# object instead of reconstructing and re-hashing it per call
+
+@lru_cache(maxsize=512)
+def _font(
+    name: str | None,
+    size: int | None,
+    bold: bool | None,
+    italic: bool | None,
+    underline: str | None,
+    color: str | None,
+) -> Font:
+    """Build a Font from the non-empty request parameters"""
+    from openpyxl.styles import Font
+
+    kwargs: dict[str, Any] = {}
+    if name:
+        kwargs["name"] = name
+    if size:
+        kwargs["size"] = size
+    if bold is not None:
+        kwargs["bold"] = bold
+    if italic is not None:
+        kwargs["italic"] = italic
+    if underline:
+        kwargs["underline"] = underline
+    if color:
+        kwargs["color"] = color
+    return Font(**kwargs)
+
+
+@lru_cache(maxsize=512)
+def _fill(color: str, fill_type: str) -> PatternFill:
+    """Build a PatternFill for the given color and fill type"""
+    from openpyxl.styles import PatternFill
+
+    return PatternFill(start_color=color, end_color=color, fill_type=cast(Any, fill_type))
+
+
+@lru_cache(maxsize=512)
+def _border(style: str, color: str | None, sides: tuple[str, ...]) -> Border:
+    """Build a Border with one shared Side applied to the given sides"""
+    from openpyxl.styles import Border, Side
+
+    side_kwargs: dict[str, Any] = {"style": cast(Any, style)}
+    if color:
+        side_kwargs["color"] = color
+    side = Side(**side_kwargs)
+    return Border(**dict.fromkeys(sides, side))
+
+
+@lru_cache(maxsize=512)
+def _alignment(
+    horizontal: str | None,
+    vertical: str | None,
+    wrap_text: bool | None,
+    text_rotation: int | None,
+) -> Alignment:
+    """Build an Alignment from the non-empty request parameters"""
+    from openpyxl.styles import Alignment
+
+    kwargs: dict[str, Any] = {}
+    if horizontal:
+        kwargs["horizontal"] = horizontal
+    if vertical:
+        kwargs["vertical"] = vertical
+    if wrap_text is not None:
+        kwargs["wrap_text"] = wrap_text
+    if text_rotation is not None:
+        kwargs["text_rotation"] = text_rotation
+    return Alignment(**kwargs)
+
+
+@with_workbook(OperationResult, "Failed to apply font formatting")
+def format_font(request: FontFormatRequest, ws) -> OperationResult:
     """
     Apply font formatting to a range of cells.
 
     Args:
         request: FontFormatRequest with formatting parameters
+        ws: Resolved worksheet (injected by with_workbook)
 
     Returns:
         OperationResult with success status
     """
-    try:
-        # Validate file path
-        is_valid, error = validate_file_path(request.workbook_path, must_exist=True)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Validate range
-        is_valid, error = validate_range_reference(request.range_ref)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Load workbook
-        wb = load_workbook(request.workbook_path)
-
-        # Check if sheet exists
-        if request.sheet_name not in wb.sheetnames:
-            wb.close()
-            return OperationResult(
-                success=False,
-                message=f"Sheet '{request.sheet_name}' not found. Available sheets: {wb.sheetnames}",
-            )
-
-        ws = wb[request.sheet_name]
-
-        # Create font object
-        font_kwargs = {}
-        if request.font_name:
-            font_kwargs["name"] = request.font_name
-        if request.font_size:
-            font_kwargs["size"] = request.font_size
-        if request.bold is not None:
-            font_kwargs["bold"] = request.bold
-        if request.italic is not None:
-            font_kwargs["italic"] = request.italic
-        if request.underline:
-            font_kwargs["underline"] = request.underline
-        if request.color:
-            font_kwargs["color"] = request.color
-
-        font = Font(**font_kwargs)
-
-        # Apply to range
-        for row in ws[request.range_ref]:
-            for cell in row if isinstance(row, tuple) else [row]:
-                cell.font = font
-
-        # Save workbook
-        wb.save(request.workbook_path)
-        wb.close()
-
-        return OperationResult(success=True, message=f"Font formatting applied to {request.range_ref}")
-
-    except Exception as e:
-        return OperationResult(success=False, message=f"Failed to apply font formatting: {str(e)}")
-
-
-def format_fill(request: FillFormatRequest) -> OperationResult:
+    # Get font object (memoized across calls)
+    font = _font(
+        request.font_name,
+        request.font_size,
+        request.bold,
+        request.italic,
+        request.underline,
+        request.color,
+    )
+
+    # Apply to range (integer loops with ws.cell hoisted to a local)
+    min_col, min_row, max_col, max_row = range_bounds(request.range_ref)
+    cell = ws.cell
+    for row in range(min_row, max_row + 1):
+        for col in range(min_col, max_col + 1):
+            cell(row, col).font = font
+
+    return OperationResult.model_construct(
+        success=True, message=f"Font formatting applied to {request.range_ref}"
+    )
+
+
+@with_workbook(OperationResult, "Failed to apply fill formatting")
+def format_fill(request: FillFormatRequest, ws) -> OperationResult:
     """
     Apply background fill (color) to a range of cells.
 
     Args:
         request: FillFormatRequest with formatting parameters
+        ws: Resolved worksheet (injected by with_workbook)
 
     Returns:
         OperationResult with success status
     """
-    try:
-        # Validate file path
-        is_valid, error = validate_file_path(request.workbook_path, must_exist=True)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Validate range
-        is_valid, error = validate_range_reference(request.range_ref)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Load workbook
-        wb = load_workbook(request.workbook_path)
-
-        # Check if sheet exists
-        if request.sheet_name not in wb.sheetnames:
-            wb.close()
-            return OperationResult(
-                success=False,
-                message=f"Sheet '{request.sheet_name}' not found. Available sheets: {wb.sheetnames}",
-            )
-
-        ws = wb[request.sheet_name]
-
-        # Create fill object
-        fill = PatternFill(start_color=request.color, end_color=request.color, fill_type=cast(Any, request.fill_type))
-
-        # Apply to range
-        for row in ws[request.range_ref]:
-            for cell in row if isinstance(row, tuple) else [row]:
-                cell.fill = fill
+    # Get fill object (memoized across calls)
+    fill = _fill(request.color, request.fill_type)
 
-        # Save workbook
-        wb.save(request.workbook_path)
-        wb.close()
+    # Apply to range (integer loops with ws.cell hoisted to a local)
+    min_col, min_row, max_col, max_row = range_bounds(request.range_ref)
+    cell = ws.cell
+    for row in range(min_row, max_row + 1):
+        for col in range(min_col, max_col + 1):
+            cell(row, col).fill = fill
 
-        return OperationResult(success=True, message=f"Fill formatting applied to {request.range_ref}")
+    return OperationResult.model_construct(
+        success=True, message=f"Fill formatting applied to {request.range_ref}"
+    )
 
-    except Exception as e:
-        return OperationResult(success=False, message=f"Failed to apply fill formatting: {str(e)}")
 
-
-def format_border(request: BorderFormatRequest) -> OperationResult:
+@with_workbook(OperationResult, "Failed to apply border formatting")
+def format_border(request: BorderFormatRequest, ws) -> OperationResult:
     """
     Apply border formatting to a range of cells.
 
     Args:
         request: BorderFormatRequest with formatting parameters
+        ws: Resolved worksheet (injected by with_workbook)
 
     Returns:
         OperationResult with success status
     """
-    try:
-        # Validate file path
-        is_valid, error = validate_file_path(request.workbook_path, must_exist=True)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Validate range
-        is_valid, error = validate_range_reference(request.range_ref)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Load workbook
-        wb = load_workbook(request.workbook_path)
-
-        # Check if sheet exists
-        if request.sheet_name not in wb.sheetnames:
-            wb.close()
-            return OperationResult(
-                success=False,
-                message=f"Sheet '{request.sheet_name}' not found. Available sheets: {wb.sheetnames}",
-            )
-
-        ws = wb[request.sheet_name]
-
-        # Create side object for border
-        side_kwargs: dict[str, Any] = {"style": cast(Any, request.style)}
-        if request.color:
-            side_kwargs["color"] = request.color
-
-        side = Side(**side_kwargs)
-
-        # Create border object with specified sides
-        border_kwargs = {}
-        if "top" in request.sides:
-            border_kwargs["top"] = side
-        if "bottom" in request.sides:
-            border_kwargs["bottom"] = side
-        if "left" in request.sides:
-            border_kwargs["left"] = side
-        if "right" in request.sides:
-            border_kwargs["right"] = side
-
-        border = Border(**border_kwargs)
-
-        # Apply to range
-        for row in ws[request.range_ref]:
-            for cell in row if isinstance(row, tuple) else [row]:
-                cell.border = border
-
-        # Save workbook
-        wb.save(request.workbook_path)
-        wb.close()
-
-        return OperationResult(success=True, message=f"Border formatting applied to {request.range_ref}")
-
-    except Exception as e:
-        return OperationResult(success=False, message=f"Failed to apply border formatting: {str(e)}")
-
-
-def format_alignment(request: AlignmentFormatRequest) -> OperationResult:
+    # Get border object (memoized across calls; sides sorted for a stable cache key)
+    border = _border(request.style, request.color, tuple(sorted(request.sides)))
+
+    # Apply to range (integer loops with ws.cell hoisted to a local)
+    min_col, min_row, max_col, max_row = range_bounds(request.range_ref)
+    cell = ws.cell
+    for row in range(min_row, max_row + 1):
+        for col in range(min_col, max_col + 1):
+            cell(row, col).border = border
+
+    return OperationResult.model_construct(
+        success=True, message=f"Border formatting applied to {request.range_ref}"
+    )
+
+
+@with_workbook(OperationResult, "Failed to apply alignment formatting")
+def format_alignment(request: AlignmentFormatRequest, ws) -> OperationResult:
     """
     Apply alignment formatting to a range of cells.
 
     Args:
         request: AlignmentFormatRequest with formatting parameters
+        ws: Resolved worksheet (injected by with_workbook)
 
     Returns:
         OperationResult with success status
     """
-    try:
-        # Validate file path
-        is_valid, error = validate_file_path(request.workbook_path, must_exist=True)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Validate range
-        is_valid, error = validate_range_reference(request.range_ref)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Load workbook
-        wb = load_workbook(request.workbook_path)
-
-        # Check if sheet exists
-        if request.sheet_name not in wb.sheetnames:
-            wb.close()
-            return OperationResult(
-                success=False,
-                message=f"Sheet '{request.sheet_name}' not found. Available sheets: {wb.sheetnames}",
-            )
-
-        ws = wb[request.sheet_name]
-
-        # Create alignment object
-        alignment_kwargs = {}
-        if request.horizontal:
-            alignment_kwargs["horizontal"] = request.horizontal
-        if request.vertical:
-            alignment_kwargs["vertical"] = request.vertical
-        if request.wrap_text is not None:
-            alignment_kwargs["wrap_text"] = request.wrap_text
-        if request.text_rotation is not None:
-            alignment_kwargs["text_rotation"] = request.text_rotation
-
-        alignment = Alignment(**alignment_kwargs)
-
-        # Apply to range
-        for row in ws[request.range_ref]:
-            for cell in row if isinstance(row, tuple) else [row]:
-                cell.alignment = alignment
-
-        # Save workbook
-        wb.save(request.workbook_path)
-        wb.close()
-
-        return OperationResult(success=True, message=f"Alignment formatting applied to {request.range_ref}")
-
-    except Exception as e:
-        return OperationResult(success=False, message=f"Failed to apply alignment formatting: {str(e)}")
-
-
-def format_number(request: NumberFormatRequest) -> OperationResult:
+    # Get alignment object (memoized across calls)
+    alignment = _alignment(
+        request.horizontal, request.vertical, request.wrap_text, request.text_rotation
+    )
+
+    # Apply to range (integer loops with ws.cell hoisted to a local)
+    min_col, min_row, max_col, max_row = range_bounds(request.range_ref)
+    cell = ws.cell
+    for row in range(min_row, max_row + 1):
+        for col in range(min_col, max_col + 1):
+            cell(row, col).alignment = alignment
+
+    return OperationResult.model_construct(
+        success=True, message=f"Alignment formatting applied to {request.range_ref}"
+    )
+
+
+@with_workbook(OperationResult, "Failed to apply number formatting")
+def format_number(request: NumberFormatRequest, ws) -> OperationResult:
     """
     Apply number formatting to a range of cells.
 
     Args:
         request: NumberFormatRequest with format string
+        ws: Resolved worksheet (injected by with_workbook)
 
     Returns:
         OperationResult with success status
     """
-    try:
-        # Validate file path
-        is_valid, error = validate_file_path(request.workbook_path, must_exist=True)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Validate range
-        is_valid, error = validate_range_reference(request.range_ref)
-        if not is_valid:
-            return OperationResult(success=False, message=error)
-
-        # Load workbook
-        wb = load_workbook(request.workbook_path)
-
-        # Check if sheet exists
-        if request.sheet_name not in wb.sheetnames:
-            wb.close()
-            return OperationResult(
-                success=False,
-                message=f"Sheet '{request.sheet_name}' not found. Available sheets: {wb.sheetnames}",
-            )
-
-        ws = wb[request.sheet_name]
-
-        # Apply number format to range
-        for row in ws[request.range_ref]:
-            for cell in row if isinstance(row, tuple) else [row]:
-                cell.number_format = request.format_string
-
-        # Save workbook
-        wb.save(request.workbook_path)
-        wb.close()
-
-        return OperationResult(success=True, message=f"Number formatting applied to {request.range_ref}")
-
-    except Exception as e:
-        return OperationResult(success=False, message=f"Failed to apply number formatting: {str(e)}")
+    # Apply number format to range (integer loops with ws.cell hoisted to a local)
+    min_col, min_row, max_col, max_row = range_bounds(request.range_ref)
+    cell = ws.cell
+    format_string = request.format_string
+    for row in range(min_row, max_row + 1):
+        for col in range(min_col, max_col + 1):
+            cell(row, col).number_format = format_string
+
+    return OperationResult.model_construct(
+        success=True, message=f"Number formatting applied to {request.range_ref}"
+    )
@@ -1,10 +1,11 @@
 """Sheet operations"""
 
 
-from openpyxl import load_workbook
-
 from ..models import SheetCreateRequest, SheetRenameRequest, SheetResult
+from ..utils.fast_meta import sheet_names
 from ..utils.validators import validate_file_path, validate_sheet_name
+from ..utils.xlsx_surgery import rename_sheet_entry
+from ..workbook_cache import get_workbook_sheets, invalidate, save_workbook
 
 
 def create(request: SheetCreateRequest) -> SheetResult:
@@ -21,41 +22,43 @@ def create(request: SheetCreateRequest) -> SheetResult:
         # Validate file path
         is_valid, error = validate_file_path(request.workbook_path, must_exist=True)
         if not is_valid:
-            return SheetResult(success=False, message=error)
+            return SheetResult.model_construct(success=False, message=error)
 
         # Validate sheet name
         is_valid, error = validate_sheet_name(request.sheet_name)
         if not is_valid:
-            return SheetResult(success=False, message=error)
-
-        # Load workbook
-        wb = load_workbook(request.workbook_path)
+            return SheetResult.model_construct(success=False, message=error)
 
-        # Check if sheet already exists
-        if request.sheet_name in wb.sheetnames:
-            wb.close()
-            return SheetResult(
+        # Check for a name conflict against xl/workbook.xml before paying for
+        # a workbook load; agents hit this error path often
+        if request.sheet_name in sheet_names(request.workbook_path):
+            return SheetResult.model_construct(
                 success=False,
                 message=f"Sheet '{request.sheet_name}' already exists",
                 sheet_name=request.sheet_name,
             )
 
+        # Get workbook (cached across calls)
+        wb, _ = get_workbook_sheets(request.workbook_path)
+
         # Create new sheet
         if request.index is not None:
             wb.create_sheet(request.sheet_name, request.index)
         else:
             wb.create_sheet(request.sheet_name)
 
-        # Save workbook
-        wb.save(request.workbook_path)
-        wb.close()
+        # Save workbook (write-through; refreshes the cached sheet-name set)
+        save_workbook(wb, request.workbook_path)
 
-        return SheetResult(
-            success=True, message=f"Sheet '{request.sheet_name}' created successfully", sheet_name=request.sheet_name
+        return SheetResult.model_construct(
+            success=True,
+            message=f"Sheet '{request.sheet_name}' created successfully",
+            sheet_name=request.sheet_name,
         )
 
     except Exception as e:
-        return SheetResult(success=False, message=f"Failed to create sheet: {str(e)}")
+        invalidate(request.workbook_path)
+        return SheetResult.model_construct(success=False, message=f"Failed to create sheet: {str(e)}")
 
 
 def delete(workbook_path: str, sheet_name: str) -> SheetResult:
@@ -73,36 +76,38 @@ def delete(workbook_path: str, sheet_name: str) -> SheetResult:
         # Validate file path
         is_valid, error = validate_file_path(workbook_path, must_exist=True)
         if not is_valid:
-            return SheetResult(success=False, message=error)
+            return SheetResult.model_construct(success=False, message=error)
 
-        # Load workbook
-        wb = load_workbook(workbook_path)
+        # Get workbook (cached across calls)
+        wb, sheets = get_workbook_sheets(workbook_path)
 
         # Check if sheet exists
-        if sheet_name not in wb.sheetnames:
-            wb.close()
-            return SheetResult(
+        if sheet_name not in sheets:
+            return SheetResult.model_construct(
                 success=False,
-                message=f"Sheet '{sheet_name}' not found. Available sheets: {wb.sheetnames}",
+                message=f"Sheet '{sheet_name}' not found. Available sheets: {sorted(sheets)}",
                 sheet_name=sheet_name,
             )
 
         # Prevent deleting the last sheet
-        if len(wb.sheetnames) == 1:
-            wb.close()
-            return SheetResult(success=False, message="Cannot delete the last sheet in the workbook")
+        if len(sheets) == 1:
+            return SheetResult.model_construct(
+                success=False, message="Cannot delete the last sheet in the workbook"
+            )
 
         # Delete sheet
         del wb[sheet_name]
 
-        # Save workbook
-        wb.save(workbook_path)
-        wb.close()
+        # Save workbook (write-through; refreshes the cached sheet-name set)
+        save_workbook(wb, workbook_path)
 
-        return SheetResult(success=True, message=f"Sheet '{sheet_name}' deleted successfully", sheet_name=sheet_name)
+        return SheetResult.model_construct(
+            success=True, message=f"Sheet '{sheet_name}' deleted successfully", sheet_name=sheet_name
+        )
 
     except Exception as e:
-        return SheetResult(success=False, message=f"Failed to delete sheet: {str(e)}")
+        invalidate(workbook_path)
+        return SheetResult.model_construct(success=False, message=f"Failed to delete sheet: {str(e)}")
 
 
 def rename(request: SheetRenameRequest) -> SheetResult:
@@ -119,46 +124,51 @@ def rename(request: SheetRenameRequest) -> SheetResult:
         # Validate file path
         is_valid, error = validate_file_path(request.workbook_path, must_exist=True)
         if not is_valid:
-            return SheetResult(success=False, message=error)
+            return SheetResult.model_construct(success=False, message=error)
 
         # Validate new sheet name
         is_valid, error = validate_sheet_name(request.new_name)
         if not is_valid:
-            return SheetResult(success=False, message=error)
+            return SheetResult.model_construct(success=False, message=error)
 
-        # Load workbook
-        wb = load_workbook(request.workbook_path)
+        # Check names against xl/workbook.xml only; no workbook load needed
+        names = sheet_names(request.workbook_path)
 
         # Check if old sheet exists
-        if request.old_name not in wb.sheetnames:
-            wb.close()
-            return SheetResult(
+        if request.old_name not in names:
+            return SheetResult.model_construct(
                 success=False,
-                message=f"Sheet '{request.old_name}' not found. Available sheets: {wb.sheetnames}",
+                message=f"Sheet '{request.old_name}' not found. Available sheets: {names}",
                 sheet_name=request.old_name,
             )
 
         # Check if new name already exists
-        if request.new_name in wb.sheetnames:
-            wb.close()
-            return SheetResult(success=False, message=f"Sheet '{request.new_name}' already exists")
-
-        # Rename sheet
-        ws = wb[request.old_name]
-        ws.title = request.new_name
-
-        # Save workbook
-        wb.save(request.workbook_path)
-        wb.close()
+        if request.new_name in names:
+            return SheetResult.model_construct(
+                success=False, message=f"Sheet '{request.new_name}' already exists"
+            )
 
-        return SheetResult(
+        # Fast path: rewrite only xl/workbook.xml in the archive instead of
+        # re-serializing every cell and style through openpyxl
+        try:
+            rename_sheet_entry(request.workbook_path, request.old_name, request.new_name)
+            invalidate(request.workbook_path)
+        except Exception:
+            # Fall back to the full openpyxl round-trip
+            wb, _ = get_workbook_sheets(request.workbook_path)
+            ws = wb[request.old_name]
+            ws.title = request.new_name
+            save_workbook(wb, request.workbook_path)
+
+        return SheetResult.model_construct(
             success=True,
             message=f"Sheet renamed from '{request.old_name}' to '{request.new_name}'",
             sheet_name=request.new_name,
         )
 
     except Exception as e:
-        return SheetResult(success=False, message=f"Failed to rename sheet: {str(e)}")
+        invalidate(request.workbook_path)
+        return SheetResult.model_construct(success=False, message=f"Failed to rename sheet: {str(e)}")
 
 
 def copy_sheet(workbook_path: str, source_sheet: str, new_name: str) -> SheetResult:
@@ -177,42 +187,61 @@ def copy_sheet(workbook_path: str, source_sheet: str, new_name: str) -> SheetRes
         # Validate file path
         is_valid, error = validate_file_path(workbook_path, must_exist=True)
         if not is_valid:
-            return SheetResult(success=False, message=error)
+            return SheetResult.model_construct(success=False, message=error)
 
         # Validate new sheet name
         is_valid, error = validate_sheet_name(new_name)
         if not is_valid:
-            return SheetResult(success=False, message=error)
+            return SheetResult.model_construct(success=False, message=error)
 
-        # Load workbook
-        wb = load_workbook(workbook_path)
+        # Check both names against xl/workbook.xml before paying for a
+        # workbook load; agents hit these error paths often
+        names = sheet_names(workbook_path)
 
         # Check if source sheet exists
-        if source_sheet not in wb.sheetnames:
-            wb.close()
-            return SheetResult(
+        if source_sheet not in names:
+            return SheetResult.model_construct(
                 success=False,
-                message=f"Sheet '{source_sheet}' not found. Available sheets: {wb.sheetnames}",
+                message=f"Sheet '{source_sheet}' not found. Available sheets: {names}",
                 sheet_name=source_sheet,
             )
 
         # Check if new name already exists
-        if new_name in wb.sheetnames:
-            wb.close()
-            return SheetResult(success=False, message=f"Sheet '{new_name}' already exists")
+        if new_name in names:
+            return SheetResult.model_construct(
+                success=False, message=f"Sheet '{new_name}' already exists"
+            )
 
-        # Copy sheet
+        # Get workbook (cached across calls)
+        wb, _ = get_workbook_sheets(workbook_path)
+
+        # Copy sheet — a truly bare source (common when templating new tabs)
+        # needs no O(cells) deep copy. The fast path only applies when there is
+        # no sheet-level state either (dimensions, freeze panes, tab color);
+        # copy_worksheet preserves all of that and a fresh sheet would not.
         source = wb[source_sheet]
-        target = wb.copy_worksheet(source)
-        target.title = new_name
+        if (
+            not source._cells
+            and not source.merged_cells.ranges
+            and not source.column_dimensions
+            and not source.row_dimensions
+            and source.freeze_panes is None
+            and source.sheet_properties.tabColor is None
+        ):
+            wb.create_sheet(new_name)
+        else:
+            target = wb.copy_worksheet(source)
+            target.title = new_name
 
-        # Save workbook
-        wb.save(workbook_path)
-        wb.close()
+        # Save workbook (write-through; refreshes the cached sheet-name set)
+        save_workbook(wb, workbook_path)
 
-        return SheetResult(
-            success=True, message=f"Sheet '{source_sheet}' copied to '{new_name}'", sheet_name=new_name
+        return SheetResult.model_construct(
+            success=True,
+            message=f"Sheet '{source_sheet}' copied to '{new_name}'",
+            sheet_name=new_name,
         )
 
     except Exception as e:
-        return SheetResult(success=False, message=f"Failed to copy sheet: {str(e)}")
+        invalidate(workbook_path)
+        return SheetResult.model_construct(success=False, message=f"Failed to copy sheet: {str(e)}")
@@ -1,14 +1,34 @@
 """Workbook operations"""
 
+import os
+import zipfile
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
 from openpyxl.utils.exceptions import InvalidFileException
 
+from .. import workbook_cache
 from ..models import WorkbookInfo, WorkbookResult
+from ..utils.fast_meta import sheet_names
 from ..utils.validators import validate_file_path
 
 
+@lru_cache(maxsize=1)
+def _empty_xlsx_bytes() -> bytes:
+    """
+    Serialized empty workbook, built once per process.
+
+    Every new workbook starts identical, so create() can write these bytes
+    straight to disk instead of constructing openpyxl's default object graph
+    (styles, theme, sheet) and re-serializing it per call.
+    """
+    buffer = BytesIO()
+    Workbook().save(buffer)
+    return buffer.getvalue()
+
+
 def create(file_path: str) -> WorkbookResult:
     """
     Create a new Excel workbook.
@@ -31,9 +51,9 @@ def create(file_path: str) -> WorkbookResult:
                 success=False, message=f"File already exists: {file_path}", file_path=file_path
             )
 
-        # Create new workbook
-        wb = Workbook()
-        wb.save(file_path)
+        # Create new workbook (one byte write; no per-call openpyxl round-trip)
+        with open(file_path, "wb") as f:
+            f.write(_empty_xlsx_bytes())
 
         return WorkbookResult(success=True, message="Workbook created successfully", file_path=file_path)
 
@@ -52,30 +72,26 @@ def open_file(file_path: str) -> WorkbookInfo:
         WorkbookInfo with workbook metadata
     """
     try:
-        # Validate file path
-        is_valid, error = validate_file_path(file_path, must_exist=True)
+        # Validate file path (shape only; existence comes from the stat below,
+        # so the metadata path makes exactly one stat syscall)
+        is_valid, error = validate_file_path(file_path)
         if not is_valid:
             raise ValueError(error)
 
-        # Load workbook
-        wb = load_workbook(file_path, read_only=True, data_only=False)
+        # Get file size (raises FileNotFoundError for missing files)
+        file_size = os.stat(file_path).st_size
 
-        # Get sheet names
-        sheets = wb.sheetnames
+        # Get sheet names (workbook.xml only; no worksheet/style parsing)
+        sheets = sheet_names(file_path)
         sheet_count = len(sheets)
 
-        # Get file size
-        file_size = Path(file_path).stat().st_size
-
-        wb.close()
-
         return WorkbookInfo(
             file_path=file_path, sheets=sheets, sheet_count=sheet_count, file_size=file_size
         )
 
     except FileNotFoundError as e:
         raise ValueError(f"File not found: {file_path}") from e
-    except InvalidFileException as e:
+    except (InvalidFileException, zipfile.BadZipFile) as e:
         raise ValueError(f"Invalid Excel file: {file_path}") from e
     except Exception as e:
         raise ValueError(f"Failed to open workbook: {str(e)}") from e
@@ -97,12 +113,8 @@ def list_sheets(file_path: str) -> list[str]:
         if not is_valid:
             raise ValueError(error)
 
-        # Load workbook
-        wb = load_workbook(file_path, read_only=True, keep_links=False)
-        sheets = wb.sheetnames
-        wb.close()
-
-        return sheets
+        # Get sheet names (workbook.xml only; no worksheet/style parsing)
+        return sheet_names(file_path)
 
     except FileNotFoundError as e:
         raise ValueError(f"File not found: {file_path}") from e
@@ -126,10 +138,10 @@ def save(file_path: str) -> WorkbookResult:
         if not is_valid:
             return WorkbookResult(success=False, message=error)
 
-        # Load and save workbook (this validates it's a proper Excel file)
-        wb = load_workbook(file_path)
-        wb.save(file_path)
-        wb.close()
+        # Flush the cached handle if one is open; operations save write-through,
+        # so with nothing cached the file on disk is already current and there
+        # is no point reloading it just to serialize it again
+        workbook_cache.flush(file_path)
 
         return WorkbookResult(success=True, message="Workbook saved successfully", file_path=file_path)
 
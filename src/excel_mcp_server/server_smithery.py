@@ -32,6 +32,7 @@ from .models import (
     CellWriteRequest,
     FillFormatRequest,
     FontFormatRequest,
+    FormulaWriteRequest,
     NumberFormatRequest,
     RangeReadRequest,
     RangeWriteRequest,
@@ -118,7 +119,10 @@ def create_server():
         Returns:
             Dictionary with success status and message
         """
-        request = SheetCreateRequest(workbook_path=workbook_path, sheet_name=sheet_name, index=index)
+        # Plain-string fields with checks in operations.sheet; skip model validation
+        request = SheetCreateRequest.model_construct(
+            workbook_path=workbook_path, sheet_name=sheet_name, index=index
+        )
         result = operations.sheet.create(request)
         return result.model_dump()
 
@@ -150,7 +154,10 @@ def create_server():
         Returns:
             Dictionary with success status and message
         """
-        request = SheetRenameRequest(workbook_path=workbook_path, old_name=old_name, new_name=new_name)
+        # Plain-string fields with checks in operations.sheet; skip model validation
+        request = SheetRenameRequest.model_construct(
+            workbook_path=workbook_path, old_name=old_name, new_name=new_name
+        )
         result = operations.sheet.rename(request)
         return result.model_dump()
 
@@ -256,9 +263,34 @@ def create_server():
         Returns:
             Dictionary with success status
         """
-        result = operations.cell.write_formula(workbook_path, sheet_name, cell, formula)
+        request = FormulaWriteRequest(
+            workbook_path=workbook_path, sheet_name=sheet_name, cell=cell, formula=formula
+        )
+        result = operations.cell.write_formula(request)
         return result.model_dump()
 
+    @mcp.tool()
+    def apply_operations(workbook_path: str, ops: list[dict]) -> dict:
+        """
+        Apply a batch of operations to one workbook, saving once.
+
+        Much faster than issuing many single-operation calls: the workbook is
+        loaded and serialized a single time for the whole batch.
+
+        Args:
+            workbook_path: Path to the Excel workbook
+            ops: List of operation dicts. Each names its operation under "op"
+                plus that operation's own parameters, e.g.
+                [{"op": "write_cell", "sheet_name": "Sheet1", "cell": "A1", "value": 42},
+                 {"op": "format_font", "sheet_name": "Sheet1", "range_ref": "A1:A1", "bold": true}]
+                Supported ops: write_cell, write_range, write_formula, format_font,
+                format_fill, format_border, format_alignment, format_number
+
+        Returns:
+            Dictionary with overall success, a summary message, and per-op results
+        """
+        return operations.batch.apply(workbook_path, ops)
+
     # ==================== FORMATTING OPERATIONS ====================
 
     @mcp.tool()
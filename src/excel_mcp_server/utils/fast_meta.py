@@ -0,0 +1,45 @@
+"""Streaming workbook metadata readers.
+
+Metadata tools only need a few attributes out of xl/workbook.xml; even a
+read_only load_workbook still inflates styles, shared strings, and worksheet
+parts. These helpers parse just the relevant zip member with iterparse, so the
+cost is O(workbook.xml size) — kilobytes — regardless of workbook size.
+"""
+
+import zipfile
+from xml.etree.ElementTree import ParseError, iterparse
+
+from openpyxl import load_workbook
+
+_SHEET_TAG = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}sheet"
+
+
+def sheet_names(path: str) -> list[str]:
+    """
+    Read sheet names directly from xl/workbook.xml inside the XLSX zip.
+
+    Falls back to a minimal-flags load_workbook for files the fast path
+    cannot parse.
+
+    Args:
+        path: Path to the Excel workbook
+
+    Returns:
+        List of sheet names in workbook order
+    """
+    try:
+        with zipfile.ZipFile(path) as zf, zf.open("xl/workbook.xml") as part:
+            names = []
+            for _, elem in iterparse(part, events=("end",)):
+                if elem.tag == _SHEET_TAG:
+                    names.append(elem.get("name"))
+                elem.clear()
+            return names
+    except (KeyError, ParseError):
+        # Unusual container layout or XML; let openpyxl figure it out with the
+        # cheapest flags (no formulas, no external link tables, streaming mode)
+        wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            return wb.sheetnames
+        finally:
+            wb.close()
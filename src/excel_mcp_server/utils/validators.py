@@ -1,7 +1,19 @@
 """Validation utilities for Excel operations"""
 
+import os
 import re
-from pathlib import Path
+from itertools import product
+from string import ascii_uppercase
+
+# Compiled once at import; re.match with a literal pays a cache lookup (and
+# lock) on every call. The capturing groups let callers pull the row number
+# without a second regex pass.
+_CELL_RE = re.compile(r"^([A-Z]{1,3})([1-9]\d*)$")
+_RANGE_RE = re.compile(r"^([A-Z]{1,3})([1-9]\d*):([A-Z]{1,3})([1-9]\d*)$")
+_HEX_RE = re.compile(r"^[0-9A-Fa-f]{6}$")
+
+# Characters Excel forbids in sheet names
+_INVALID_SHEET_CHARS = frozenset(":\\/?*[]")
 
 
 def validate_file_path(path: str, must_exist: bool = False) -> tuple[bool, str | None]:
@@ -16,25 +28,19 @@ def validate_file_path(path: str, must_exist: bool = False) -> tuple[bool, str |
         Tuple of (is_valid, error_message)
     """
     try:
-        file_path = Path(path)
-
-        # Check file extension
-        if file_path.suffix.lower() != ".xlsx":
+        # Check file extension (os.path calls avoid allocating Path objects
+        # on this per-tool-call hot path)
+        if os.path.splitext(path)[1].lower() != ".xlsx":
             return False, "File must have .xlsx extension"
 
         # Check if file exists (when required)
-        if must_exist and not file_path.exists():
+        if must_exist and not os.path.exists(path):
             return False, f"File not found: {path}"
 
         # Check if parent directory exists
-        if not file_path.parent.exists():
-            return False, f"Parent directory does not exist: {file_path.parent}"
-
-        # Check for path traversal attempts
-        try:
-            file_path.resolve()
-        except (ValueError, RuntimeError):
-            return False, "Invalid file path"
+        parent = os.path.dirname(path) or "."
+        if not os.path.isdir(parent):
+            return False, f"Parent directory does not exist: {parent}"
 
         return True, None
 
@@ -53,17 +59,14 @@ def validate_cell_reference(cell: str) -> tuple[bool, str | None]:
         Tuple of (is_valid, error_message)
     """
     # Valid format: Column (A-ZZ) + Row (1-1048576)
-    pattern = r"^[A-Z]{1,3}[1-9]\d*$"
-
-    if not re.match(pattern, cell.upper()):
+    match = _CELL_RE.match(cell.upper())
+    if not match:
         return False, f"Invalid cell reference: {cell}. Expected format like 'A1' or 'B10'"
 
-    # Extract row number and validate
-    row_match = re.search(r"\d+", cell)
-    if row_match:
-        row = int(row_match.group())
-        if row > 1048576:  # Excel's max row
-            return False, f"Row number {row} exceeds Excel's maximum (1048576)"
+    # Row number comes out of the match; no second regex pass
+    row = int(match.group(2))
+    if row > 1048576:  # Excel's max row
+        return False, f"Row number {row} exceeds Excel's maximum (1048576)"
 
     return True, None
 
@@ -78,18 +81,21 @@ def validate_range_reference(range_ref: str) -> tuple[bool, str | None]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Valid format: Cell:Cell
-    pattern = r"^[A-Z]{1,3}[1-9]\d*:[A-Z]{1,3}[1-9]\d*$"
-
-    if not re.match(pattern, range_ref.upper()):
+    # Valid format: Cell:Cell — one match yields both endpoints' pieces
+    match = _RANGE_RE.match(range_ref.upper())
+    if not match:
         return False, f"Invalid range reference: {range_ref}. Expected format like 'A1:B10'"
 
-    # Validate individual cells
-    cells = range_ref.split(":")
-    for cell in cells:
-        is_valid, error = validate_cell_reference(cell)
-        if not is_valid:
-            return False, error
+    start_col, start_row, end_col, end_row = match.groups()
+    start_row, end_row = int(start_row), int(end_row)
+
+    for row in (start_row, end_row):
+        if row > 1048576:  # Excel's max row
+            return False, f"Row number {row} exceeds Excel's maximum (1048576)"
+
+    # Endpoints must be ordered top-left to bottom-right
+    if start_row > end_row or column_letter_to_number(start_col) > column_letter_to_number(end_col):
+        return False, f"Invalid range reference: {range_ref}. Start cell must not be past end cell"
 
     return True, None
 
@@ -137,11 +143,11 @@ def validate_sheet_name(name: str) -> tuple[bool, str | None]:
     if len(name) > 31:
         return False, "Sheet name cannot exceed 31 characters"
 
-    # Invalid characters for sheet names
-    invalid_chars = [":", "\\", "/", "?", "*", "[", "]"]
-    for char in invalid_chars:
-        if char in name:
-            return False, f"Sheet name cannot contain '{char}'"
+    # Invalid characters for sheet names (one set intersection instead of
+    # seven substring scans)
+    bad = _INVALID_SHEET_CHARS.intersection(name)
+    if bad:
+        return False, f"Sheet name cannot contain '{min(bad)}'"
 
     return True, None
 
@@ -159,12 +165,31 @@ def validate_color_hex(color: str) -> tuple[bool, str | None]:
     # Remove # if present
     color = color.lstrip("#")
 
-    if not re.match(r"^[0-9A-Fa-f]{6}$", color):
+    if not _HEX_RE.match(color):
         return False, f"Invalid hex color: {color}. Expected format like 'FF0000' or '#FF0000'"
 
     return True, None
 
 
+def _build_column_tables() -> tuple[dict[str, int], dict[int, str]]:
+    """Build letter<->number tables for every 1-3 letter column (A..XFD and beyond)"""
+    col2num: dict[str, int] = {}
+    num2col: dict[int, str] = {}
+    number = 0
+    for length in (1, 2, 3):
+        for letters in product(ascii_uppercase, repeat=length):
+            number += 1
+            column = "".join(letters)
+            col2num[column] = number
+            num2col[number] = column
+    return col2num, num2col
+
+
+# Excel columns are at most 3 letters (max XFD = 16384), so one pair of tables
+# built at import replaces the per-call chr/ord loops on hot range paths
+_COL2NUM, _NUM2COL = _build_column_tables()
+
+
 def column_letter_to_number(column: str) -> int:
     """
     Convert column letter to number (A=1, B=2, ..., Z=26, AA=27, etc.)
@@ -175,10 +200,14 @@ def column_letter_to_number(column: str) -> int:
     Returns:
         Column number
     """
-    number = 0
-    for char in column.upper():
-        number = number * 26 + (ord(char) - ord("A") + 1)
-    return number
+    try:
+        return _COL2NUM[column.upper()]
+    except KeyError:
+        # Longer-than-3-letter input (beyond Excel's range); keep the old math
+        number = 0
+        for char in column.upper():
+            number = number * 26 + (ord(char) - ord("A") + 1)
+        return number
 
 
 def column_number_to_letter(number: int) -> str:
@@ -191,9 +220,13 @@ def column_number_to_letter(number: int) -> str:
     Returns:
         Column letter(s)
     """
-    letter = ""
-    while number > 0:
-        number -= 1
-        letter = chr(number % 26 + ord("A")) + letter
-        number //= 26
-    return letter
+    try:
+        return _NUM2COL[number]
+    except KeyError:
+        # Beyond the 3-letter table (or non-positive)
+        letter = ""
+        while number > 0:
+            number -= 1
+            letter = ascii_uppercase[number % 26] + letter
+            number //= 26
+        return letter
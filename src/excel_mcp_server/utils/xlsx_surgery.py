@@ -0,0 +1,65 @@
+"""Targeted XLSX metadata edits via zip member rewriting.
+
+openpyxl's save re-serializes the entire workbook — all cell data and styles —
+even when only sheet metadata changed. For edits confined to xl/workbook.xml
+(like renaming a sheet) we can rewrite just that member and stream-copy the
+rest of the archive, skipping the XML object model entirely. Callers should
+treat any exception from this module as "fast path unavailable" and fall back
+to openpyxl.
+"""
+
+import os
+import re
+import tempfile
+import zipfile
+from xml.sax.saxutils import quoteattr
+
+_WORKBOOK_PART = "xl/workbook.xml"
+
+
+def rename_sheet_entry(path: str, old_name: str, new_name: str) -> None:
+    """
+    Rename a sheet by rewriting only xl/workbook.xml inside the archive.
+
+    The replacement is a targeted attribute edit on the raw XML bytes (no
+    re-serialization, so namespace prefixes and element order are untouched).
+    If the sheet's name attribute cannot be located unambiguously — e.g. it
+    collides with a defined name — a ValueError is raised and the caller
+    should fall back to openpyxl.
+
+    Args:
+        path: Path to the Excel workbook
+        old_name: Current sheet name (must exist in the workbook)
+        new_name: New sheet name
+
+    Raises:
+        ValueError: If the name attribute is not found exactly once
+    """
+    old_attr = f"name={quoteattr(old_name)}".encode()
+    new_attr = f"name={quoteattr(new_name)}".encode()
+    pattern = re.compile(rb"(<sheet\b[^>]*?)" + re.escape(old_attr))
+
+    tmp_path = None
+    try:
+        with zipfile.ZipFile(path) as zf:
+            xml = zf.read(_WORKBOOK_PART)
+            xml, count = pattern.subn(rb"\1" + new_attr, xml)
+            if count != 1:
+                raise ValueError(
+                    f"Sheet name attribute for '{old_name}' matched {count} times"
+                )
+
+            # Stream-copy every other member into a sibling temp file, then
+            # atomically replace the original
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".xlsx")
+            os.close(fd)
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as out:
+                for item in zf.infolist():
+                    data = xml if item.filename == _WORKBOOK_PART else zf.read(item.filename)
+                    out.writestr(item, data)
+
+        os.replace(tmp_path, path)
+        tmp_path = None
+    finally:
+        if tmp_path is not None:
+            os.unlink(tmp_path)
@@ -0,0 +1,193 @@
+"""Shared workbook-handle cache for Excel operations.
+
+Sequential MCP tool calls typically hit the same workbook many times; reloading
+and reparsing the XLSX on every call dominates the cost of small operations.
+This module keeps a small LRU of open workbook handles keyed by path and load
+flags, invalidated by file mtime. Writes stay write-through: operations still
+save after mutating, and save_workbook refreshes the cached mtime so the handle
+survives its own save.
+"""
+
+import datetime
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from os import stat
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from openpyxl import load_workbook
+from openpyxl.workbook import Workbook
+from openpyxl.writer.excel import ExcelWriter
+
+_MAX_ENTRIES = 8
+
+# zlib level 1 deflates several times faster than the default level 6 at a
+# modest size cost — the right trade for agent working files that are saved
+# after every mutating tool call
+_COMPRESS_LEVEL = 1
+
+# (path, data_only, read_only) -> (workbook, mtime_ns at load/save time, sheet-name set)
+_cache: OrderedDict[tuple[str, bool, bool], tuple[Workbook, int, set[str]]] = OrderedDict()
+
+# FastMCP runs sync tools on worker threads, so concurrent tool calls can hit
+# the cache at once; reentrant because flush() saves through save_workbook()
+_lock = threading.RLock()
+
+
+def _get_entry(
+    path: str, data_only: bool, read_only: bool, keep_links: bool
+) -> tuple[Workbook, set[str]]:
+    """Return (workbook, sheet-name set), loading and caching as needed"""
+    key = (path, data_only, read_only)
+    mtime = stat(path).st_mtime_ns
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            wb, cached_mtime, names = entry
+            if cached_mtime == mtime:
+                _cache.move_to_end(key)
+                return wb, names
+            # File changed on disk behind us; drop the stale handle
+            wb.close()
+            del _cache[key]
+
+        wb = load_workbook(path, data_only=data_only, read_only=read_only, keep_links=keep_links)
+        _cache[key] = (wb, mtime, set(wb.sheetnames))
+        if len(_cache) > _MAX_ENTRIES:
+            _, (evicted, _, _) = _cache.popitem(last=False)
+            evicted.close()
+        return _cache[key][0], _cache[key][2]
+
+
+def get_workbook(
+    path: str,
+    *,
+    data_only: bool = False,
+    read_only: bool = False,
+    keep_links: bool = True,
+) -> Workbook:
+    """
+    Return a cached workbook handle for the given path and load flags.
+
+    The cached handle is reused as long as the file's mtime is unchanged;
+    otherwise the stale handle is closed and the file is reloaded.
+
+    Args:
+        path: Path to the Excel workbook (must exist)
+        data_only: Load cached formula results instead of formulas
+        read_only: Use openpyxl's streaming read-only mode
+        keep_links: Preserve external links when loading
+
+    Returns:
+        An open openpyxl Workbook
+    """
+    return _get_entry(path, data_only, read_only, keep_links)[0]
+
+
+def get_workbook_sheets(
+    path: str,
+    *,
+    data_only: bool = False,
+    read_only: bool = False,
+    keep_links: bool = True,
+) -> tuple[Workbook, set[str]]:
+    """
+    Return a cached workbook handle together with its cached sheet-name set.
+
+    The set is computed once per load (wb.sheetnames rebuilds a list on every
+    access) and refreshed whenever the workbook is saved through the cache.
+
+    Args:
+        path: Path to the Excel workbook (must exist)
+        data_only: Load cached formula results instead of formulas
+        read_only: Use openpyxl's streaming read-only mode
+        keep_links: Preserve external links when loading
+
+    Returns:
+        Tuple of (workbook, sheet-name set)
+    """
+    return _get_entry(path, data_only, read_only, keep_links)
+
+
+def save_workbook(wb: Workbook, path: str, *, durable: bool = False) -> None:
+    """
+    Save a workbook atomically and refresh its cached mtime.
+
+    Serializes into a sibling temp file through a 1 MiB buffered writer, then
+    os.replace()s it over the target — a crash mid-save never leaves a
+    truncated workbook behind. With durable=True the temp file is fsync'd
+    before the swap; routine write-through saves skip that stall and rely on
+    the OS writeback.
+
+    Args:
+        wb: The workbook to save (typically obtained from get_workbook)
+        path: Path to save to
+        durable: Force the bytes to disk before replacing the target
+    """
+    with _lock:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".xlsx")
+        try:
+            with open(fd, "wb", buffering=1 << 20) as f:
+                # Mirror openpyxl's save_workbook, but with a fast compression
+                # level; openpyxl itself offers no knob for the ZipFile it creates
+                archive = ZipFile(
+                    f, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=_COMPRESS_LEVEL
+                )
+                wb.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(
+                    tzinfo=None
+                )
+                ExcelWriter(wb, archive).save()
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            tmp_path = None
+        finally:
+            if tmp_path is not None:
+                os.unlink(tmp_path)
+
+        # Drop read-mode handles for this path: their cached mtime may still
+        # match on filesystems with coarse mtime granularity, so the compare in
+        # _get_entry cannot be trusted to notice this save
+        key = (path, False, False)
+        for stale_key in [k for k in _cache if k[0] == path and k != key]:
+            stale, _, _ = _cache.pop(stale_key)
+            stale.close()
+
+        if key in _cache:
+            # Refresh the sheet-name set too: sheet create/delete/rename lands here
+            _cache[key] = (wb, stat(path).st_mtime_ns, set(wb.sheetnames))
+
+
+def flush(path: str) -> bool:
+    """
+    Save the cached write-mode handle for a path, if one exists.
+
+    Returns:
+        True if a cached handle was saved, False if nothing was cached
+    """
+    with _lock:
+        entry = _cache.get((path, False, False))
+        if entry is None:
+            return False
+        # An explicit save/flush request is the point where durability matters
+        save_workbook(entry[0], path, durable=True)
+        return True
+
+
+def invalidate(path: str) -> None:
+    """Close and drop every cached handle for the given path"""
+    with _lock:
+        for key in [k for k in _cache if k[0] == path]:
+            wb, _, _ = _cache.pop(key)
+            wb.close()
+
+
+def clear() -> None:
+    """Close and drop all cached handles"""
+    with _lock:
+        for wb, _, _ in _cache.values():
+            wb.close()
+        _cache.clear()
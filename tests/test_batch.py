@@ -0,0 +1,107 @@
+"""Tests for batched operations"""
+
+from excel_mcp_server.models import CellReadRequest
+from excel_mcp_server.operations import batch, cell
+
+
+def test_apply_operations(sample_workbook):
+    """Test applying a batch of operations with a single save"""
+    result = batch.apply(
+        sample_workbook,
+        [
+            {"op": "write_cell", "sheet_name": "Sheet1", "cell": "D1", "value": "Batch"},
+            {"op": "write_range", "sheet_name": "Sheet1", "start_cell": "E1", "data": [[1, 2]]},
+            {"op": "format_font", "sheet_name": "Sheet1", "range_ref": "A1:C1", "bold": True},
+        ],
+    )
+
+    assert result["success"] is True
+    assert len(result["results"]) == 3
+
+    read = cell.read_cell_value(
+        CellReadRequest(workbook_path=sample_workbook, sheet_name="Sheet1", cell="D1")
+    )
+    assert read.value == "Batch"
+
+
+def test_apply_operations_continues_after_failure(sample_workbook):
+    """Test that a failing op is recorded and later ops still run"""
+    result = batch.apply(
+        sample_workbook,
+        [
+            {"op": "write_cell", "sheet_name": "NonExistent", "cell": "A1", "value": 1},
+            {"op": "write_cell", "sheet_name": "Sheet1", "cell": "D2", "value": 2},
+        ],
+    )
+
+    assert result["success"] is False
+    assert result["results"][0]["success"] is False
+    assert "not found" in result["results"][0]["message"].lower()
+    assert result["results"][1]["success"] is True
+
+
+def test_write_cells(sample_workbook):
+    """Test the bulk cell-write convenience wrapper"""
+    result = batch.write_cells(
+        sample_workbook, [("Sheet1", "D1", 1), ("Sheet1", "D2", 2), ("Sheet1", "D3", 3)]
+    )
+
+    assert result["success"] is True
+
+    read = cell.read_cell_value(
+        CellReadRequest(workbook_path=sample_workbook, sheet_name="Sheet1", cell="D3")
+    )
+    assert read.value == 3
+
+
+def test_apply_operations_ignores_redundant_workbook_path(sample_workbook):
+    """Test that an op repeating workbook_path doesn't abort the batch"""
+    result = batch.apply(
+        sample_workbook,
+        [
+            {
+                "op": "write_cell",
+                "workbook_path": sample_workbook,
+                "sheet_name": "Sheet1",
+                "cell": "D1",
+                "value": 1,
+            },
+        ],
+    )
+
+    assert result["success"] is True
+    assert result["results"][0]["success"] is True
+
+
+def test_apply_operations_rejects_conflicting_workbook_path(sample_workbook, tmp_path):
+    """Test that an op naming a different workbook fails instead of being redirected"""
+    other = str(tmp_path / "other.xlsx")
+    result = batch.apply(
+        sample_workbook,
+        [
+            {
+                "op": "write_cell",
+                "workbook_path": other,
+                "sheet_name": "Sheet1",
+                "cell": "D1",
+                "value": 1,
+            },
+        ],
+    )
+
+    assert result["success"] is False
+    assert "does not match" in result["results"][0]["message"]
+
+    # The batch workbook must be untouched
+    read = cell.read_cell_value(
+        CellReadRequest(workbook_path=sample_workbook, sheet_name="Sheet1", cell="D1")
+    )
+    assert read.value is None
+
+
+def test_apply_operations_unknown_op(sample_workbook):
+    """Test that an unknown operation name is rejected"""
+    result = batch.apply(sample_workbook, [{"op": "explode", "sheet_name": "Sheet1"}])
+
+    assert result["success"] is False
+    assert "unknown operation" in result["results"][0]["message"].lower()
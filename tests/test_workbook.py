@@ -1,8 +1,10 @@
 """Tests for workbook operations"""
 
 import pytest
-from pathlib import Path
+from openpyxl import load_workbook
+
 from excel_mcp_server.operations import workbook
+from excel_mcp_server.utils import validators
 
 
 def test_create_workbook(temp_dir):
@@ -11,13 +13,18 @@ def test_create_workbook(temp_dir):
     result = workbook.create(str(file_path))
 
     assert result.success is True
-    assert Path(file_path).exists()
     assert result.file_path == str(file_path)
 
+    # create() writes precomputed bytes, so this is the one place the suite
+    # verifies they are actually a loadable workbook
+    wb = load_workbook(file_path)
+    assert wb.sheetnames == ["Sheet"]
+
 
-def test_create_workbook_already_exists(sample_workbook):
-    """Test that creating an existing workbook fails"""
-    result = workbook.create(sample_workbook)
+def test_create_workbook_already_exists(monkeypatch):
+    """Test that creating an existing workbook fails (existence check mocked, no disk I/O)"""
+    monkeypatch.setattr(workbook.Path, "exists", lambda self: True)
+    result = workbook.create("/tmp/existing.xlsx")
 
     assert result.success is False
     assert "already exists" in result.message.lower()
@@ -59,12 +66,17 @@ def test_list_sheets(sample_workbook):
     assert "Sheet1" in sheets
 
 
-def test_save_workbook(sample_workbook):
-    """Test saving a workbook"""
-    result = workbook.save(sample_workbook)
+def test_save_workbook(monkeypatch):
+    """Test saving a workbook (path check and cache flush mocked, no disk I/O)"""
+    flushed = []
+    monkeypatch.setattr(validators.os.path, "exists", lambda path: True)
+    monkeypatch.setattr(workbook.workbook_cache, "flush", lambda path: flushed.append(path) or True)
+
+    result = workbook.save("/tmp/cached.xlsx")
 
     assert result.success is True
-    assert result.file_path == sample_workbook
+    assert result.file_path == "/tmp/cached.xlsx"
+    assert flushed == ["/tmp/cached.xlsx"]
 
 
 def test_get_info(sample_workbook):
@@ -0,0 +1,43 @@
+"""Tests for the shared workbook-handle cache"""
+
+import os
+
+from openpyxl import load_workbook
+
+from excel_mcp_server import workbook_cache
+
+
+def test_cache_reuses_handle(sample_workbook):
+    """Test that repeated gets for the same path return the same handle"""
+    wb1 = workbook_cache.get_workbook(sample_workbook)
+    wb2 = workbook_cache.get_workbook(sample_workbook)
+
+    assert wb1 is wb2
+    workbook_cache.invalidate(sample_workbook)
+
+
+def test_cache_reloads_after_external_change(sample_workbook):
+    """Test that an external file change invalidates the cached handle"""
+    wb1 = workbook_cache.get_workbook(sample_workbook)
+
+    # Modify the file outside the cache
+    wb = load_workbook(sample_workbook)
+    wb["Sheet1"]["A1"] = "Changed"
+    wb.save(sample_workbook)
+    wb.close()
+    os.utime(sample_workbook)
+
+    wb2 = workbook_cache.get_workbook(sample_workbook)
+    assert wb2 is not wb1
+    assert wb2["Sheet1"]["A1"].value == "Changed"
+    workbook_cache.invalidate(sample_workbook)
+
+
+def test_save_keeps_handle_valid(sample_workbook):
+    """Test that saving through the cache does not invalidate the handle"""
+    wb = workbook_cache.get_workbook(sample_workbook)
+    wb["Sheet1"]["A1"] = "Saved"
+    workbook_cache.save_workbook(wb, sample_workbook)
+
+    assert workbook_cache.get_workbook(sample_workbook) is wb
+    workbook_cache.invalidate(sample_workbook)